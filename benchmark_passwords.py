@@ -0,0 +1,128 @@
+"""
+Login throughput benchmark for the password hashing service.
+Logger threads keep posting to /login while one admin thread loads
+/admin/dashboard, for each supported hashing algorithm at its configured
+cost. Reports logins per second, logins per second per hashing core and
+how many dashboard requests got through meanwhile. It then times logins
+while an admin uploads a file of new students, whose passwords are hashed
+in their own pool, against logins on an idle server.
+
+Usage: python benchmark_passwords.py [seconds per run] [login threads] [upload rows]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Use a throwaway database so the benchmark never touches hostel.db
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+
+from app import app, db, User, password_hash_method
+from werkzeug.security import generate_password_hash
+
+def seed(users):
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        # Every account shares one hash, so seeding costs a single hash
+        password_hash = generate_password_hash('benchmark', password_hash_method())
+        db.session.add(User(username='admin', email='admin@hostel.com', password_hash=password_hash,
+                            full_name='Admin', role='admin'))
+        for i in range(users):
+            db.session.add(User(username=f'student{i}', email=f'student{i}@hostel.com', password_hash=password_hash,
+                                full_name=f'Student {i}', role='student', gender='male', student_id=f'B{i}'))
+        db.session.commit()
+
+def run(seconds, threads):
+    counts = {'logins': 0, 'errors': 0, 'dashboard': 0}
+    lock = threading.Lock()
+    deadline = time.time() + seconds
+
+    def login(i):
+        client = app.test_client()
+        done = errors = 0
+        while time.time() < deadline:
+            response = client.post('/login', data={'username': f'student{i}', 'password': 'benchmark'})
+            if response.status_code == 302 and '/student/dashboard' in response.headers['Location']:
+                done += 1
+            else:
+                errors += 1
+            client.get('/logout')
+        with lock:
+            counts['logins'] += done
+            counts['errors'] += errors
+
+    def dashboard():
+        client = app.test_client()
+        client.post('/login', data={'username': 'admin', 'password': 'benchmark'})
+        done = 0
+        while time.time() < deadline:
+            done += client.get('/admin/dashboard').status_code == 200
+        counts['dashboard'] = done
+
+    workers = [threading.Thread(target=login, args=(i,)) for i in range(threads)]
+    workers.append(threading.Thread(target=dashboard))
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return {name: value / seconds for name, value in counts.items()}
+
+def login_ms(client):
+    started = time.perf_counter()
+    client.post('/login', data={'username': 'student0', 'password': 'benchmark'})
+    elapsed = (time.perf_counter() - started) * 1000
+    client.get('/logout')
+    return elapsed
+
+def upload_run(rows):
+    """Login latencies in ms on an idle server and while rows students are uploaded."""
+    seed(1)
+    admin = app.test_client()
+    admin.post('/login', data={'username': 'admin', 'password': 'benchmark'})
+    student = app.test_client()
+    idle = [login_ms(student) for _ in range(5)]
+
+    upload = 'username,email,full_name,student_id,gender,phone,password\n' + ''.join(
+        f'upload{i},upload{i}@hostel.com,Upload {i},U{i},male,,\n' for i in range(rows))
+    finished = threading.Event()
+
+    def post_upload():
+        admin.post('/admin/reports/import/students', data={'file': (io.BytesIO(upload.encode()), 'students.csv')},
+                   content_type='multipart/form-data')
+        finished.set()
+
+    uploader = threading.Thread(target=post_upload)
+    uploader.start()
+    during = []
+    while not finished.is_set():
+        during.append(login_ms(student))
+    uploader.join()
+    return idle, during
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cores = min(app.config['PASSWORD_HASH_WORKERS'], os.cpu_count() or 1)
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else cores * 4
+    upload_rows = int(sys.argv[3]) if len(sys.argv) > 3 else 60
+
+    print(f"{threads} login threads, {app.config['PASSWORD_HASH_WORKERS']} hashing workers "
+          f"on {os.cpu_count()} cores, {seconds:g}s per run\n")
+    for algorithm in ('scrypt', 'pbkdf2'):
+        app.config['PASSWORD_HASH_ALGORITHM'] = algorithm
+        seed(threads)
+        started = time.perf_counter()
+        generate_password_hash('benchmark', password_hash_method())
+        hash_ms = (time.perf_counter() - started) * 1000
+
+        result = run(seconds, threads)
+        print(f"{password_hash_method()}: {hash_ms:.0f} ms per hash, {result['logins']:.1f} logins/s "
+              f"({result['logins'] / cores:.1f} per core), {result['errors']:.1f} errors/s, "
+              f"{result['dashboard']:.1f} dashboard requests/s")
+
+        idle, during = upload_run(upload_rows)
+        print(f"    login during a {upload_rows}-row student upload: median {sorted(during)[len(during) // 2]:.0f} ms, "
+              f"worst {max(during):.0f} ms over {len(during)} logins (idle median {sorted(idle)[2]:.0f} ms)")
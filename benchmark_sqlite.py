@@ -0,0 +1,107 @@
+"""
+Concurrency benchmark for the SQLite performance profile.
+Measures read throughput on /student/rooms and /admin/dashboard while writer
+threads keep submitting complaints, first with SQLite's default rollback
+journal settings and then with the profile in app.config['SQLITE_PRAGMAS'].
+
+Usage: python benchmark_sqlite.py [seconds per run] [reader threads] [writer threads]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Use a throwaway database so the benchmark never touches hostel.db
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+
+from app import app, db, User, Block, Room
+from werkzeug.security import generate_password_hash
+
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'DELETE',
+    'synchronous': 'FULL',
+    'busy_timeout': 5000,
+    'cache_size': -2000,
+    'mmap_size': 0,
+}
+
+def seed(readers, writers):
+    with app.app_context():
+        db.create_all()
+        password_hash = generate_password_hash('benchmark')
+        db.session.add(User(username='admin', email='admin@hostel.com', password_hash=password_hash,
+                            full_name='Admin', role='admin'))
+        for name, gender in [('Block A', 'male'), ('Block B', 'female')]:
+            block = Block(name=name, gender=gender)
+            db.session.add(block)
+            db.session.flush()
+            for number in range(100):
+                db.session.add(Room(block_id=block.id, floor=number // 20 + 1, room_number=str(100 + number),
+                                    capacity=2, room_type='AC' if number % 2 else 'Non-AC', price=5000))
+        for i in range(readers + writers):
+            db.session.add(User(username=f'student{i}', email=f'student{i}@hostel.com', password_hash=password_hash,
+                                full_name=f'Student {i}', role='student', gender='male', student_id=f'B{i}'))
+        db.session.commit()
+
+def client_for(username):
+    client = app.test_client()
+    client.post('/login', data={'username': username, 'password': 'benchmark'})
+    return client
+
+def run(pragmas, seconds, readers, writers):
+    app.config['SQLITE_PRAGMAS'] = pragmas
+    with app.app_context():
+        db.engine.dispose()
+
+    counts = {'reads': 0, 'writes': 0, 'errors': 0}
+    lock = threading.Lock()
+    deadline = time.time() + seconds
+
+    def loop(client, request):
+        done = errors = 0
+        while time.time() < deadline:
+            try:
+                ok = request(client).status_code < 400
+            except Exception:
+                ok = False
+            done += ok
+            errors += not ok
+        return done, errors
+
+    def reader(i):
+        client = client_for('admin' if i % 2 else f'student{i}')
+        url = '/admin/dashboard' if i % 2 else '/student/rooms'
+        done, errors = loop(client, lambda c: c.get(url))
+        with lock:
+            counts['reads'] += done
+            counts['errors'] += errors
+
+    def writer(i):
+        client = client_for(f'student{readers + i}')
+        done, errors = loop(client, lambda c: c.post('/student/complaints', data={
+            'category': 'water', 'title': 'Benchmark', 'description': 'Write load'}))
+        with lock:
+            counts['writes'] += done
+            counts['errors'] += errors
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {name: value / seconds for name, value in counts.items()}
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    writers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    tuned = dict(app.config['SQLITE_PRAGMAS'])
+    seed(readers, writers)
+    print(f"{readers} readers, {writers} writers, {seconds:g}s per run\n")
+    for label, pragmas in [('SQLite defaults', DEFAULT_PRAGMAS), ('Tuned profile', tuned)]:
+        result = run(pragmas, seconds, readers, writers)
+        print(f"{label}: {result['reads']:.1f} reads/s, {result['writes']:.1f} writes/s, {result['errors']:.1f} errors/s")
@@ -0,0 +1,189 @@
+"""
+Benchmark suite for the allocation, reporting and export hot paths.
+Generates a synthetic data set in a throwaway database, then measures each
+scenario through the Flask test client: latency percentiles, SQL queries
+per request and peak Python memory of one traced request. Results are
+written as JSON so a later run can be checked against them.
+
+Usage:
+    python benchmark_suite.py --rows 100000 --output baseline.json
+    python benchmark_suite.py --rows 100000 --compare baseline.json
+
+The comparison fails (exit status 1) when a scenario's median latency or
+peak memory grows by more than --tolerance, or when it issues more queries.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+# Use a throwaway database so the benchmark never touches hostel.db
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+
+from app import app, db, Application
+from generate_synthetic_data import generate
+
+EXPORTS = ['students', 'fees', 'allocations', 'rooms', 'summary']
+# Differences below this many milliseconds are treated as noise
+LATENCY_NOISE_MS = 5
+
+def admin_client():
+    client = app.test_client()
+    client.post('/login', data={'username': 'admin', 'password': 'benchmark'})
+    return client
+
+def scenarios():
+    """(name, request) pairs; request() performs one request and returns the response."""
+    admin = admin_client()
+    with app.app_context():
+        pending = [application_id for (application_id,) in db.session.query(Application.id).filter(
+            Application.status == 'pending').order_by(Application.applied_at)]
+    pending = iter(pending)
+
+    def login():
+        return app.test_client().post('/login', data={'username': 'student0', 'password': 'benchmark'})
+
+    def auto_allocate():
+        return admin.post(f'/admin/application/{next(pending)}/auto_allocate')
+
+    def export(name):
+        def request():
+            # Read the streamed body chunk by chunk and drop it, so peak memory
+            # reflects the export itself rather than a buffered copy of its output
+            response = admin.get(f'/admin/reports/export/{name}', buffered=False)
+            response.streamed_bytes = sum(len(chunk) for chunk in response.response)
+            response.close()
+            return response
+        return request
+
+    return [
+        ('login', login),
+        ('view_allocations', lambda: admin.get('/admin/allocations')),
+        ('reports', lambda: admin.get('/admin/reports')),
+        *[(f'export_{name}', export(name)) for name in EXPORTS],
+        ('auto_allocate_application', auto_allocate),
+    ]
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)]
+
+def measure(request, requests):
+    queries = []
+
+    def count_query(*args):
+        queries[-1] += 1
+
+    with app.app_context():
+        db.event.listen(db.engine, 'before_cursor_execute', count_query)
+        latencies = []
+        try:
+            for _ in range(requests):
+                queries.append(0)
+                started = time.perf_counter()
+                response = request()
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code >= 400:
+                    raise RuntimeError(f'request failed with status {response.status_code}')
+        finally:
+            db.event.remove(db.engine, 'before_cursor_execute', count_query)
+
+    # Memory is traced on one extra request, as tracing slows everything down
+    tracemalloc.start()
+    response = request()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    result = {
+        'requests': requests,
+        'mean_ms': round(sum(latencies) / len(latencies), 2),
+        'p50_ms': round(percentile(latencies, 0.5), 2),
+        'p90_ms': round(percentile(latencies, 0.9), 2),
+        'p99_ms': round(percentile(latencies, 0.99), 2),
+        'queries_per_request': max(queries),
+        'peak_memory_kb': round(peak / 1024)
+    }
+    if hasattr(response, 'streamed_bytes'):
+        result['streamed_kb'] = round(response.streamed_bytes / 1024)
+    return result
+
+def compare(results, baseline, tolerance):
+    """Print a comparison table and return the list of regressions."""
+    regressions = []
+    print(f"\n{'scenario':28} {'p50 ms':>18} {'queries':>12} {'memory KiB':>20}")
+    for name, current in results['scenarios'].items():
+        base = baseline['scenarios'].get(name)
+        if base is None:
+            print(f"{name:28} (no baseline)")
+            continue
+        print(f"{name:28} {base['p50_ms']:>8} -> {current['p50_ms']:<8} "
+              f"{base['queries_per_request']:>4} -> {current['queries_per_request']:<4} "
+              f"{base['peak_memory_kb']:>8} -> {current['peak_memory_kb']:<8}")
+        if (current['p50_ms'] > base['p50_ms'] * (1 + tolerance)
+                and current['p50_ms'] - base['p50_ms'] > LATENCY_NOISE_MS):
+            regressions.append(f"{name}: median latency {base['p50_ms']} ms -> {current['p50_ms']} ms")
+        if current['queries_per_request'] > base['queries_per_request']:
+            regressions.append(f"{name}: queries per request {base['queries_per_request']} -> "
+                               f"{current['queries_per_request']}")
+        if current['peak_memory_kb'] > base['peak_memory_kb'] * (1 + tolerance):
+            regressions.append(f"{name}: peak memory {base['peak_memory_kb']} KiB -> {current['peak_memory_kb']} KiB")
+    return regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the allocation and reporting hot paths.')
+    parser.add_argument('--rows', type=int, default=100000, help='approximate size of the synthetic data set')
+    parser.add_argument('--requests', type=int, default=20, help='timed requests per scenario')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='baseline JSON to check the results against')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='allowed relative growth of latency and memory (default 0.3)')
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        counts = generate(args.rows, args.seed)
+    print(f"Generated {sum(counts.values())} rows in {time.perf_counter() - started:.1f}s\n")
+
+    results = {
+        'meta': {
+            'rows': sum(counts.values()),
+            'requests': args.requests,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'created_at': datetime.utcnow().isoformat(timespec='seconds')
+        },
+        'scenarios': {}
+    }
+    for name, request in scenarios():
+        result = measure(request, args.requests)
+        results['scenarios'][name] = result
+        print(f"{name:28} p50 {result['p50_ms']:>9} ms  p90 {result['p90_ms']:>9} ms  "
+              f"p99 {result['p99_ms']:>9} ms  {result['queries_per_request']:>3} queries  "
+              f"{result['peak_memory_kb']:>7} KiB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline['meta']['rows'] != results['meta']['rows']:
+            print(f"\nWarning: baseline has {baseline['meta']['rows']} rows, this run {results['meta']['rows']}")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('\nRegressions:')
+            for regression in regressions:
+                print(f"- {regression}")
+            sys.exit(1)
+        print('\nNo regressions')
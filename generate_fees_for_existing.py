@@ -1,55 +1,21 @@
 """
-Script to generate fees for students who already have room allocations
-but don't have fees yet
+Script to generate this month's hostel fee for students who already have
+room allocations but have not been billed yet
+
+Same as: flask --app app run-billing [--period YYYY-MM]
 """
 
-from app import app, db, User, Allocation, Fee, Room
-from datetime import datetime, timedelta
+import sys
+
+from app import app, run_billing_cycle, billing_period
 
-def generate_fees_for_existing():
+def generate_fees_for_existing(period=None):
     with app.app_context():
-        # Get all active allocations
-        allocations = Allocation.query.filter_by(status='active').all()
-        
-        fees_created = 0
-        fees_skipped = 0
-        
-        for allocation in allocations:
-            student = allocation.student
-            room = allocation.room
-            
-            # Check if student already has a pending hostel fee
-            existing_fee = Fee.query.filter_by(
-                student_id=student.id,
-                fee_type='hostel_fee',
-                status='pending'
-            ).first()
-            
-            if existing_fee:
-                print(f"Skipping {student.username} - already has pending fee")
-                fees_skipped += 1
-                continue
-            
-            # Create fee based on room price
-            amount = room.price if room.price else 5000
-            due_date = datetime.utcnow() + timedelta(days=30)
-            
-            fee = Fee(
-                student_id=student.id,
-                amount=amount,
-                fee_type='hostel_fee',
-                due_date=due_date
-            )
-            
-            db.session.add(fee)
-            fees_created += 1
-            print(f"Created fee for {student.username} - Amount: Rs{amount}, Room: {room.block.name} {room.room_number}")
-        
-        db.session.commit()
-        print(f"\nSummary:")
+        period = period or billing_period()
+        fees_created, amount = run_billing_cycle(period)
+        print(f"Summary for {period}:")
         print(f"Fees created: {fees_created}")
-        print(f"Fees skipped (already exist): {fees_skipped}")
+        print(f"Amount billed: Rs{amount:.2f}")
 
 if __name__ == '__main__':
-    generate_fees_for_existing()
-
+    generate_fees_for_existing(sys.argv[1] if len(sys.argv) > 1 else None)
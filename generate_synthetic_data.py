@@ -0,0 +1,215 @@
+"""
+Synthetic data generator for load tests and benchmarks.
+Fills blocks, rooms, students, applications, allocations, fees and
+complaints so that the total row count is roughly the requested scale
+(10k to 1M rows). Rows are written with batched executemany INSERTs and the
+statistics table is rebuilt at the end.
+
+Every account's password is 'benchmark'; the admin account is 'admin'.
+Runs against DATABASE_URL (hostel.db by default) and refuses to touch a
+database that already has users unless --reset is given, which drops every
+table first.
+
+Usage: python generate_synthetic_data.py [--rows 100000] [--seed 1] [--reset]
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from app import (app, db, User, Block, Room, Application, Allocation, Complaint, Fee,
+                 password_hash_method, rebuild_statistics, billing_period)
+from werkzeug.security import generate_password_hash
+
+BATCH_SIZE = 10000
+ROOM_TYPES = [('AC', 5000), ('Non-AC', 3500)]
+COMPLAINT_CATEGORIES = ['electricity', 'water', 'cleaning', 'furniture', 'internet', 'other']
+
+def insert(model, rows):
+    table = model.__table__
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(table.insert(), rows[start:start + BATCH_SIZE])
+
+def ids(model, *conditions):
+    return [row_id for (row_id,) in db.session.execute(
+        db.select(model.id).where(*conditions).order_by(model.id))]
+
+def month_start(date, months_back):
+    month = date.year * 12 + date.month - 1 - months_back
+    return datetime(month // 12, month % 12 + 1, 1)
+
+def generate(rows, seed=1):
+    """Generate about rows rows into an empty database; returns the row count per table."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    # Per student: one user, one application, about 0.6 allocations, 1.2 fees and 0.5 complaints
+    students = max(rows // 5, 20)
+    room_count = max(int(students * 0.7 / 2), 4)
+    block_count = max(room_count // 300, 4)
+    password_hash = generate_password_hash('benchmark', password_hash_method())
+
+    insert(Block, [{
+        'name': f'Block {i + 1}',
+        'gender': 'male' if i % 2 == 0 else 'female',
+        'description': f'Synthetic block {i + 1}'
+    } for i in range(block_count)])
+    block_ids = ids(Block)
+    block_gender = {block_id: 'male' if i % 2 == 0 else 'female' for i, block_id in enumerate(block_ids)}
+
+    # Plan the rooms first so occupancy can be written with the room
+    rooms = []
+    for i in range(room_count):
+        block_id = block_ids[i % block_count]
+        room_type, price = ROOM_TYPES[i % 2]
+        per_block = i // block_count
+        rooms.append({
+            'block_id': block_id,
+            'floor': per_block // 50 + 1,
+            'room_number': str(100 + per_block),
+            'capacity': 2,
+            'current_occupancy': 0,
+            'status': 'maintenance' if rng.random() < 0.02 else 'available',
+            'room_type': room_type,
+            'price': price
+        })
+
+    users = [{
+        'username': 'admin', 'email': 'admin@hostel.com', 'password_hash': password_hash,
+        'role': 'admin', 'gender': None, 'full_name': 'Admin User', 'student_id': None,
+        'phone': None, 'created_at': now
+    }]
+    for i in range(students):
+        users.append({
+            'username': f'student{i}',
+            'email': f'student{i}@hostel.com',
+            'password_hash': password_hash,
+            'role': 'student',
+            'gender': 'male' if i % 2 == 0 else 'female',
+            'full_name': f'Student {i}',
+            'student_id': f'S{i:07d}',
+            'phone': f'9{i:09d}',
+            'created_at': now - timedelta(days=rng.randint(0, 365))
+        })
+    insert(User, users)
+    student_ids = ids(User, User.role == 'student')
+
+    # Fill free slots per gender until about 60% of students are allocated;
+    # about 5% have already checked out and hand their slot back
+    free_slots = {'male': [], 'female': []}
+    for index, room in enumerate(rooms):
+        if room['status'] == 'available':
+            free_slots[block_gender[room['block_id']]].extend([index] * room['capacity'])
+    planned = []
+    for position, student_id in enumerate(student_ids):
+        gender = users[position + 1]['gender']
+        if rng.random() < 0.6 and free_slots[gender]:
+            index = free_slots[gender].pop()
+            checked_out = rng.random() < 0.05
+            if checked_out:
+                free_slots[gender].append(index)
+            else:
+                rooms[index]['current_occupancy'] += 1
+                if rooms[index]['current_occupancy'] >= rooms[index]['capacity']:
+                    rooms[index]['status'] = 'occupied'
+            planned.append((student_id, index, checked_out))
+    insert(Room, rooms)
+    room_ids = ids(Room)
+
+    allocated = {student_id for student_id, _, _ in planned}
+    applications = []
+    for student_id in student_ids:
+        applied_at = now - timedelta(days=rng.randint(1, 180), minutes=rng.randint(0, 1440))
+        if student_id in allocated:
+            status = 'approved'
+        else:
+            status = 'rejected' if rng.random() < 0.1 else 'pending'
+        applications.append({
+            'student_id': student_id,
+            'preferred_block': None if rng.random() < 0.5 else f'Block {rng.randint(1, block_count)}',
+            'preferred_room_type': rng.choice([None, 'AC', 'Non-AC']),
+            'reason': 'Synthetic application',
+            'status': status,
+            'applied_at': applied_at,
+            'reviewed_at': applied_at + timedelta(days=1) if status != 'pending' else None,
+            'admin_notes': None
+        })
+    insert(Application, applications)
+
+    allocations = []
+    fees = []
+    for student_id, index, checked_out in planned:
+        allocated_at = now - timedelta(days=rng.randint(1, 90))
+        allocations.append({
+            'student_id': student_id,
+            'room_id': room_ids[index],
+            'allocated_at': allocated_at,
+            'check_in_date': allocated_at,
+            'check_out_date': now if checked_out else None,
+            'checkout_reason': 'Graduation' if checked_out else None,
+            'status': 'checked_out' if checked_out else 'active'
+        })
+        for months in range(rng.randint(1, 3)):
+            issued = month_start(now, months)
+            due_date = issued + timedelta(days=rng.randint(10, 30))
+            paid = rng.random() < 0.6
+            fees.append({
+                'student_id': student_id,
+                'amount': rooms[index]['price'],
+                'fee_type': 'hostel_fee',
+                'due_date': due_date,
+                'paid_date': due_date - timedelta(days=1) if paid else None,
+                'status': 'paid' if paid else ('overdue' if due_date < now else 'pending'),
+                'receipt_number': None,
+                'payment_method': 'cash' if paid else None,
+                'billing_period': billing_period(issued)
+            })
+    insert(Allocation, allocations)
+    insert(Fee, fees)
+
+    complaints = []
+    for student_id in student_ids:
+        if rng.random() < 0.5:
+            submitted_at = now - timedelta(days=rng.randint(0, 120))
+            status = rng.choice(['open', 'open', 'in_progress', 'resolved', 'closed'])
+            complaints.append({
+                'student_id': student_id,
+                'category': rng.choice(COMPLAINT_CATEGORIES),
+                'title': 'Synthetic complaint',
+                'description': 'Generated for load testing',
+                'status': status,
+                'submitted_at': submitted_at,
+                'resolved_at': submitted_at + timedelta(days=2) if status == 'resolved' else None,
+                'admin_response': None,
+                'assigned_to': None
+            })
+    insert(Complaint, complaints)
+
+    db.session.commit()
+    rebuild_statistics()
+    return {
+        'blocks': block_count,
+        'rooms': len(rooms),
+        'users': len(users),
+        'applications': len(applications),
+        'allocations': len(allocations),
+        'fees': len(fees),
+        'complaints': len(complaints)
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Fill the database with synthetic hostel data.')
+    parser.add_argument('--rows', type=int, default=100000, help='approximate total number of rows (default 100000)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed, for repeatable data sets')
+    parser.add_argument('--reset', action='store_true', help='drop and recreate every table first')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.reset:
+            db.drop_all()
+        db.create_all()
+        if User.query.first():
+            parser.error('the database already has users; pass --reset to replace everything')
+        counts = generate(args.rows, args.seed)
+        for table, count in counts.items():
+            print(f"{table.capitalize()}: {count}")
+        print(f"\nTotal rows: {sum(counts.values())}")
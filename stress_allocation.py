@@ -0,0 +1,131 @@
+"""
+Concurrency stress test for room allocation.
+Seeds a throwaway database with far more pending applications than free
+slots, then lets worker threads auto-allocate them through the admin route
+while one more thread runs the bulk allocate-pending pass. Afterwards it
+checks that no room is over capacity, that every room's occupancy matches
+its active allocations, that no student holds two allocations and that the
+statistics table has not drifted.
+
+Runs against a temporary SQLite database unless --database-url is given;
+that database is dropped and recreated, so never point it at real data.
+
+Usage: python stress_allocation.py [--threads 16] [--students 400] [--rooms 20] [--database-url URL]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
+
+parser = argparse.ArgumentParser(description='Allocate rooms from many threads and check occupancy never exceeds capacity.')
+parser.add_argument('--threads', type=int, default=16, help='concurrent admin workers (default 16)')
+parser.add_argument('--students', type=int, default=400, help='pending applications to allocate (default 400)')
+parser.add_argument('--rooms', type=int, default=20, help='rooms per block, two blocks of capacity-2 rooms (default 20)')
+parser.add_argument('--database-url', help='database to drop, seed and test instead of a temporary SQLite file')
+args = parser.parse_args()
+
+os.environ['DATABASE_URL'] = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'stress.db')
+
+from app import (app, db, User, Block, Room, Application, Allocation, read_statistics, get_statistics,
+                 allocate_pending_applications, rebuild_statistics)
+from sqlalchemy.exc import IntegrityError
+from werkzeug.security import generate_password_hash
+
+def seed(students, rooms_per_block):
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        # Every account shares one hash, so seeding costs a single hash
+        password_hash = generate_password_hash('stress')
+        db.session.add(User(username='admin', email='admin@hostel.com', password_hash=password_hash,
+                            full_name='Admin', role='admin'))
+        for name, gender in [('Block A', 'male'), ('Block B', 'female')]:
+            block = Block(name=name, gender=gender)
+            db.session.add(block)
+            db.session.flush()
+            for number in range(rooms_per_block):
+                db.session.add(Room(block_id=block.id, floor=number // 10 + 1, room_number=str(100 + number),
+                                    capacity=2, current_occupancy=0, status='available', room_type='AC', price=5000))
+        for i in range(students):
+            student = User(username=f'student{i}', email=f'student{i}@hostel.com', password_hash=password_hash,
+                           full_name=f'Student {i}', role='student', gender='male' if i % 2 else 'female',
+                           student_id=f'S{i}')
+            db.session.add(student)
+            db.session.flush()
+            db.session.add(Application(student_id=student.id))
+        db.session.commit()
+        rebuild_statistics()
+        return [application_id for (application_id,) in db.session.query(Application.id).order_by(Application.id)]
+
+def run(application_ids, threads):
+    statuses = Counter()
+    lock = threading.Lock()
+    start = threading.Barrier(threads + 1)
+
+    def worker(chunk):
+        client = app.test_client()
+        client.post('/login', data={'username': 'admin', 'password': 'stress'})
+        start.wait()
+        for application_id in chunk:
+            status = client.post(f'/admin/application/{application_id}/auto_allocate').status_code
+            with lock:
+                statuses[status] += 1
+
+    def bulk():
+        start.wait()
+        with app.app_context():
+            while True:
+                try:
+                    placed, _ = allocate_pending_applications()
+                    break
+                except IntegrityError:
+                    # A worker allocated one of the same students first; the unique
+                    # allocation.student_id constraint rolls the whole pass back
+                    db.session.rollback()
+                    with lock:
+                        statuses['bulk passes rolled back'] += 1
+        with lock:
+            statuses['bulk placed'] += len(placed)
+
+    workers = [threading.Thread(target=worker, args=(application_ids[i::threads],)) for i in range(threads)]
+    workers.append(threading.Thread(target=bulk))
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return statuses
+
+def check():
+    """Return a list of invariant violations."""
+    problems = []
+    with app.app_context():
+        active = Counter(room_id for (room_id,) in db.session.query(Allocation.room_id).filter(
+            Allocation.status == 'active'))
+        for room in Room.query:
+            if room.current_occupancy > room.capacity:
+                problems.append(f'room {room.id} holds {room.current_occupancy} of {room.capacity}')
+            if room.current_occupancy != active.get(room.id, 0):
+                problems.append(f'room {room.id} occupancy {room.current_occupancy} but {active.get(room.id, 0)} allocations')
+        students = Counter(student_id for (student_id,) in db.session.query(Allocation.student_id))
+        problems += [f'student {student_id} has {count} allocations' for student_id, count in students.items() if count > 1]
+        stored, live = read_statistics(), get_statistics()
+        problems += [f'statistic {name} is {stored[name]}, expected {live[name]}' for name in live if stored[name] != live[name]]
+    return problems
+
+if __name__ == '__main__':
+    application_ids = seed(args.students, args.rooms)
+    print(f"{args.students} applications for {args.rooms * 2 * 2} slots, {args.threads} workers plus a bulk pass")
+    statuses = run(application_ids, args.threads)
+    for status, count in sorted(statuses.items(), key=str):
+        print(f"{status}: {count}")
+
+    problems = check()
+    if problems:
+        print('\nViolations:')
+        for problem in problems:
+            print(f"- {problem}")
+        sys.exit(1)
+    print('\nNo room over capacity, occupancy matches allocations, statistics consistent')
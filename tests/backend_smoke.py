@@ -0,0 +1,77 @@
+"""
+Smoke run of the app against the database in DATABASE_URL, which is dropped
+and recreated. Run by test_backends.py in a fresh interpreter per backend,
+because the database URL is read when app is imported.
+
+Usage: DATABASE_URL=postgresql://... python tests/backend_smoke.py
+"""
+
+import os
+import sys
+
+os.environ.setdefault('PASSWORD_HASH_ALGORITHM', 'pbkdf2')
+os.environ.setdefault('PASSWORD_HASH_COST', '1000')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (app, db, User, Room, Application, Allocation, hash_password, upgrade_database,
+                 read_statistics, get_statistics)
+
+with app.app_context():
+    backend = db.engine.dialect.name
+
+def check(condition, message):
+    if not condition:
+        sys.exit(f'{backend}: {message}')
+
+with app.app_context():
+    db.drop_all()
+    db.create_all()
+    # An older schema without user.phone; user is a reserved word on PostgreSQL
+    with db.engine.begin() as connection:
+        connection.execute(db.text(
+            f'ALTER TABLE {db.engine.dialect.identifier_preparer.format_table(User.__table__)} DROP COLUMN phone'
+        ))
+    created = upgrade_database()
+    check('user.phone' in created, f'upgrade_database created {created}')
+    db.session.add(User(username='admin', email='admin@hostel.com', password_hash=hash_password('admin'),
+                        full_name='Admin', role='admin'))
+    db.session.commit()
+
+admin = app.test_client()
+admin.post('/login', data={'username': 'admin', 'password': 'admin'})
+admin.post('/admin/blocks', data={'name': 'Block A', 'gender': 'male', 'description': ''})
+with app.app_context():
+    block_id = db.session.execute(db.text('SELECT id FROM block')).scalar_one()
+admin.post('/admin/rooms', data={'block_id': block_id, 'floor': 1, 'room_number': '101', 'capacity': 2,
+                                 'room_type': 'AC', 'price': 5000})
+
+for i in range(2):
+    student = app.test_client()
+    student.post('/register', data={'username': f'student{i}', 'email': f'student{i}@hostel.com', 'password': 'pw',
+                                    'full_name': f'Student {i}', 'student_id': f'S{i}', 'phone': '555',
+                                    'gender': 'male'})
+    student.post('/login', data={'username': f'student{i}', 'password': 'pw'})
+    student.post('/student/apply', data={'preferred_block': 'Block A', 'preferred_room_type': 'AC', 'reason': ''})
+    student.post('/student/complaints', data={'category': 'water', 'title': 'Leak', 'description': 'Tap leaks'})
+    check(student.get('/student/dashboard').status_code == 200, 'student dashboard failed')
+
+with app.app_context():
+    application_ids = [application_id for (application_id,) in db.session.query(Application.id)]
+check(len(application_ids) == 2, f'{len(application_ids)} applications')
+for application_id in application_ids:
+    admin.post(f'/admin/application/{application_id}/auto_allocate')
+
+for page in ('/admin/dashboard', '/admin/applications', '/admin/allocations', '/admin/complaints', '/admin/fees',
+             '/admin/rooms', '/admin/blocks', '/admin/reports'):
+    status = admin.get(page).status_code
+    check(status == 200, f'{page} returned {status}')
+
+with app.app_context():
+    check(Allocation.query.count() == 2, f'{Allocation.query.count()} allocations')
+    check(Room.query.one().current_occupancy == 2, 'room occupancy is not 2')
+    stored, live = read_statistics(), get_statistics()
+    check(stored == live, f'statistics {stored} differ from {live}')
+    db.session.remove()
+    db.drop_all()
+
+print(f'{backend}: ok')
@@ -0,0 +1,37 @@
+import os
+import sys
+import tempfile
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+# Tests run against TEST_DATABASE_URL when set (it is dropped and recreated),
+# otherwise against a throwaway SQLite file
+os.environ['DATABASE_URL'] = os.environ.get('TEST_DATABASE_URL') or \
+    'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app as flask_app, db, fragment_cache, room_catalog, user_cache, User
+
+@pytest.fixture
+def app():
+    flask_app.config['TESTING'] = True
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+    # Per-process caches outlive the tables they were built from
+    for cache in (fragment_cache, room_catalog, user_cache):
+        cache.clear()
+
+@pytest.fixture
+def admin_client(app):
+    """A test client logged in as a fresh admin account."""
+    db.session.add(User(username='admin', email='admin@hostel.com', full_name='Admin', role='admin',
+                        password_hash=generate_password_hash('test', method='pbkdf2:sha256:1')))
+    db.session.commit()
+    client = app.test_client()
+    client.post('/login', data={'username': 'admin', 'password': 'test'})
+    return client
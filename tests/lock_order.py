@@ -0,0 +1,109 @@
+"""
+Two writers that reach the shared statistic and data_version rows through
+different code paths, run against DATABASE_URL, which is dropped and
+recreated. Run by test_backends.py in a fresh interpreter per backend.
+
+One transaction reserves a room slot, as approving an application does; the
+other edits a room through the ORM, as the rooms page, the API and imports
+do. Neither may lock a shared row before it commits, and both must lock them
+in the same order, or PostgreSQL deadlocks the pair.
+
+Usage: DATABASE_URL=postgresql://... python tests/lock_order.py
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (app, db, Block, Room, DataVersion, reserve_room_slot, rebuild_statistics, read_statistics,
+                 get_statistics)
+
+SHARED_TABLES = ['statistic', 'data_version']
+
+with app.app_context():
+    backend = db.engine.dialect.name
+
+def check(condition, message):
+    if not condition:
+        sys.exit(f'{backend}: {message}')
+
+def reserve(room_id):
+    check(reserve_room_slot(db.session.get(Room, room_id)), f'room {room_id} is full')
+
+def edit(room_id):
+    db.session.get(Room, room_id).status = 'maintenance'
+    db.session.flush()
+
+def room_version():
+    return db.session.get(DataVersion, 'rooms').version
+
+with app.app_context():
+    db.drop_all()
+    db.create_all()
+    block = Block(name='Block A', gender='male')
+    db.session.add(block)
+    db.session.flush()
+    rooms = [Room(block_id=block.id, floor=1, room_number=str(100 + i), capacity=2, current_occupancy=0,
+                  status='available', room_type='AC', price=5000) for i in range(3)]
+    db.session.add_all(rooms)
+    db.session.commit()
+    room_ids = [room.id for room in rooms]
+    rebuild_statistics()
+    version = room_version()
+
+# Each path writes the shared rows last, in SHARED_TABLES order
+writes = []
+
+def record_write(connection, cursor, statement, parameters, context, executemany):
+    words = statement.split()
+    if words[0] in ('INSERT', 'UPDATE', 'DELETE'):
+        writes.append(words[1 if words[0] == 'UPDATE' else 2].strip('"'))
+
+for step, room_id in [(reserve, room_ids[0]), (edit, room_ids[0])]:
+    with app.app_context():
+        writes.clear()
+        db.event.listen(db.engine, 'before_cursor_execute', record_write)
+        try:
+            step(room_id)
+            db.session.commit()
+        finally:
+            db.event.remove(db.engine, 'before_cursor_execute', record_write)
+    shared = [table for table in writes if table in SHARED_TABLES]
+    check(shared and writes[len(writes) - len(shared):] == shared, f'{step.__name__} wrote {writes}')
+    check(shared == sorted(shared, key=SHARED_TABLES.index), f'{step.__name__} wrote {shared}')
+
+# Both transactions hold their room row while the other runs. SQLite admits
+# one writer at a time, so there the two cannot interleave at all.
+if backend != 'sqlite':
+    barrier = threading.Barrier(2, timeout=10)
+    errors = []
+
+    def run(step, room_id):
+        with app.app_context():
+            try:
+                step(room_id)
+                barrier.wait()
+                db.session.commit()
+            except Exception as e:
+                errors.append(f'{step.__name__}: {e!r}')
+                barrier.abort()
+
+    threads = [threading.Thread(target=run, args=(reserve, room_ids[1])),
+               threading.Thread(target=run, args=(edit, room_ids[2]))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    check(not errors, '; '.join(errors))
+
+with app.app_context():
+    expected = version + (2 if backend == 'sqlite' else 4)
+    check(room_version() == expected, f'room version is {room_version()}, expected {expected}')
+    stored, live = read_statistics(), get_statistics()
+    check(stored == live, f'statistics {stored} differ from {live}')
+    db.session.remove()
+    db.drop_all()
+
+print(f'{backend}: ok')
@@ -0,0 +1,50 @@
+"""The bulk API rejects records the web forms would not accept, row by row."""
+
+from werkzeug.security import generate_password_hash
+
+from app import db, User, Block, Fee, read_statistics
+
+def add_student():
+    student = User(username='student', email='student@hostel.com', full_name='Student', role='student',
+                   gender='male', student_id='S1', password_hash=generate_password_hash('test', method='pbkdf2:sha256:1'))
+    db.session.add(student)
+    db.session.commit()
+    return student.id
+
+def rejected(response):
+    assert response.status_code == 400, response.get_json()
+    return {error['index']: error['error'] for error in response.get_json()['errors']}
+
+def test_fee_create_checks_student_amount_and_type(admin_client):
+    student_id = add_student()
+    admin_id = User.query.filter_by(role='admin').one().id
+    fee = {'amount': 100, 'fee_type': 'maintenance', 'due_date': '2026-01-01T00:00:00'}
+    errors = rejected(admin_client.post('/api/v1/fees', json=[
+        {**fee, 'student_id': student_id},
+        {**fee, 'student_id': 9999},
+        {**fee, 'student_id': admin_id},
+        {**fee, 'student_id': student_id, 'amount': -50},
+        {**fee, 'student_id': student_id, 'fee_type': 'bribe'},
+    ]))
+    assert errors == {1: 'Unknown student', 2: 'Unknown student', 3: 'amount must be at least 0',
+                      4: 'fee_type must be one of hostel_fee, maintenance, security, other, late_fee'}
+    assert Fee.query.count() == 0
+    assert read_statistics()['total_pending'] == 0
+
+    assert admin_client.post('/api/v1/fees', json=[{**fee, 'student_id': student_id}]).status_code == 201
+    fee_id = Fee.query.one().id
+    errors = rejected(admin_client.patch('/api/v1/fees', json=[{'id': fee_id, 'amount': -1},
+                                                               {'id': fee_id, 'fee_type': 'bribe'}]))
+    assert set(errors) == {0, 1}
+    assert db.session.get(Fee, fee_id).amount == 100
+
+def test_block_gender_is_male_or_female(admin_client):
+    errors = rejected(admin_client.post('/api/v1/blocks', json=[{'name': 'Block A', 'gender': 'male'},
+                                                                {'name': 'Block R', 'gender': 'robot'}]))
+    assert errors == {1: 'gender must be male or female'}
+
+    assert admin_client.post('/api/v1/blocks', json=[{'name': 'Block A', 'gender': 'male'}]).status_code == 201
+    block_id = Block.query.one().id
+    assert rejected(admin_client.patch('/api/v1/blocks', json=[{'id': block_id, 'gender': 'robot'}])) == {
+        0: 'gender must be male or female'}
+    assert db.session.get(Block, block_id).gender == 'male'
@@ -0,0 +1,40 @@
+"""Only one request at a time can be profiled; Python 3.12+ refuses a second
+active profiler, so overlapping requests must be served unprofiled."""
+
+import os
+import threading
+
+import app as hostel
+from app import profile_rules
+
+def test_overlapping_sampled_requests_are_served(admin_client, monkeypatch, tmp_path):
+    monkeypatch.setattr(hostel, 'PROFILE_DIR', str(tmp_path))
+    monkeypatch.setitem(profile_rules, 'export_students_csv', {'rate': 1, 'remaining': None})
+    monkeypatch.setitem(profile_rules, 'reports', {'rate': 1, 'remaining': None})
+
+    # Hold a profiled export open in another thread while the main thread sends a request
+    streaming, finish = threading.Event(), threading.Event()
+    export = {}
+
+    def stream_export():
+        response = admin_client.get('/admin/reports/export/students', buffered=False)
+        export['status'], export['profile'] = response.status_code, response.headers.get('X-Profile-Name')
+        streaming.set()
+        finish.wait(10)
+        response.close()
+
+    thread = threading.Thread(target=stream_export)
+    thread.start()
+    assert streaming.wait(10)
+    overlapping = admin_client.get('/admin/reports')
+    finish.set()
+    thread.join()
+
+    assert export['status'] == 200 and export['profile']
+    assert overlapping.status_code == 200
+    assert 'X-Profile-Name' not in overlapping.headers
+
+    later = admin_client.get('/admin/reports')
+    assert later.status_code == 200
+    names = [export['profile'], later.headers['X-Profile-Name']]
+    assert sorted(os.listdir(tmp_path)) == sorted(name + suffix for name in names for suffix in ('.collapsed', '.prof'))
@@ -0,0 +1,82 @@
+"""The admin list pages must issue the same number of SQL statements per page
+however many rows the tables hold, i.e. no lazy load per row."""
+
+from datetime import datetime, timedelta
+
+from werkzeug.security import generate_password_hash
+
+from app import db, User, Block, Room, Application, Allocation, Complaint, Fee, fragment_cache, rebuild_statistics
+
+PAGES = [
+    '/admin/dashboard',
+    '/admin/applications',
+    '/admin/allocations',
+    '/admin/complaints',
+    '/admin/fees',
+    '/admin/rooms',
+    '/admin/blocks',
+    '/admin/reports',
+]
+
+def seed(students):
+    """An admin plus students with an application, allocation, complaint and fee each."""
+    password_hash = generate_password_hash('test', method='pbkdf2:sha256:1')
+    db.session.add(User(username='admin', email='admin@hostel.com', password_hash=password_hash,
+                        full_name='Admin', role='admin'))
+    blocks = [Block(name='Block A', gender='male'), Block(name='Block B', gender='female')]
+    db.session.add_all(blocks)
+    db.session.flush()
+    rooms = [Room(block_id=blocks[i % 2].id, floor=1, room_number=str(100 + i), capacity=1, current_occupancy=1,
+                  status='occupied', room_type='AC', price=5000) for i in range(students)]
+    db.session.add_all(rooms)
+    db.session.flush()
+    now = datetime.utcnow()
+    for i, room in enumerate(rooms):
+        student = User(username=f'student{i}', email=f'student{i}@hostel.com', password_hash=password_hash,
+                       full_name=f'Student {i}', role='student', gender=blocks[i % 2].gender, student_id=f'S{i}')
+        db.session.add(student)
+        db.session.flush()
+        db.session.add_all([
+            Application(student_id=student.id, status='approved', applied_at=now - timedelta(minutes=i)),
+            Allocation(student_id=student.id, room_id=room.id, allocated_at=now - timedelta(minutes=i)),
+            Complaint(student_id=student.id, category='water', title='Leak', description='Tap leaks'),
+            Fee(student_id=student.id, amount=5000, fee_type='hostel_fee', due_date=now + timedelta(days=i)),
+        ])
+    db.session.commit()
+    rebuild_statistics()
+
+def statement_counts(app):
+    client = app.test_client()
+    client.post('/login', data={'username': 'admin', 'password': 'test'})
+    statements = []
+
+    def count(*args):
+        statements.append(1)
+
+    counts = {}
+    for page in PAGES:
+        # Measure a second view, once the user cache is warm, but render fragments afresh
+        assert client.get(page).status_code == 200
+        fragment_cache.clear()
+        statements.clear()
+        db.event.listen(db.engine, 'before_cursor_execute', count)
+        try:
+            response = client.get(page)
+        finally:
+            db.event.remove(db.engine, 'before_cursor_execute', count)
+        assert response.status_code == 200
+        counts[page] = len(statements)
+    return counts
+
+def test_statements_per_page_do_not_grow_with_rows(app):
+    seed(20)
+    small = statement_counts(app)
+
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+    fragment_cache.clear()
+    seed(200)
+    large = statement_counts(app)
+
+    assert large == small
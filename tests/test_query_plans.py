@@ -0,0 +1,86 @@
+"""No route may make SQLite walk a whole table that grows with the number of
+students. The statements are captured from the routes themselves, so the
+test follows the queries as they change, and each is run through EXPLAIN
+QUERY PLAN with its own parameters.
+
+The one SCAN allowed is an unfiltered first page: a query with a LIMIT, no
+WHERE and no temporary sort B-tree walks its ORDER BY index and stops after
+LIMIT rows.
+"""
+
+import pytest
+
+from app import db, Block, Room, Application, Allocation, Complaint, Fee, User, sweep_overdue_fees
+from generate_synthetic_data import generate
+
+LARGE_TABLES = {'user', 'room', 'application', 'allocation', 'complaint', 'fee'}
+
+def full_scans(statement, plan):
+    sql = ' '.join(statement.split())
+    first_page = ' LIMIT ' in sql and ' WHERE ' not in sql and not any('TEMP B-TREE' in step for step in plan)
+    scans = []
+    for step in plan:
+        words = step.split()
+        if words[0] != 'SCAN' or words[1].rstrip('_0123456789') not in LARGE_TABLES:
+            continue
+        if first_page and 'USING INDEX' in step and 'COVERING' not in step:
+            continue
+        scans.append(step)
+    return scans
+
+@pytest.fixture
+def statements(app):
+    if db.engine.dialect.name != 'sqlite':
+        pytest.skip('reads SQLite query plans')
+    captured = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.split()[0] in ('SELECT', 'UPDATE', 'DELETE'):
+            captured.append((statement, parameters))
+
+    db.event.listen(db.engine, 'before_cursor_execute', capture)
+    yield captured
+    db.event.remove(db.engine, 'before_cursor_execute', capture)
+
+def test_routes_never_scan_large_tables(app, statements):
+    generate(3000)
+    newest = {model: db.session.query(db.func.max(model.id)).scalar()
+              for model in (Application, Allocation, Complaint, Fee, Room)}
+    block = Block.query.order_by(Block.id).first()
+    pending = Application.query.filter_by(status='pending').first()
+    student = User.query.filter_by(role='student').first()
+    statements.clear()
+
+    admin = app.test_client()
+    admin.post('/login', data={'username': 'admin', 'password': 'benchmark'})
+    pages = [
+        '/admin/dashboard', '/admin/reports', '/admin/blocks',
+        '/admin/applications', '/admin/applications?status=pending', f'/admin/applications?block={block.name}',
+        f'/admin/applications?after={newest[Application]}',
+        '/admin/allocations', '/admin/allocations?status=active', f'/admin/allocations?block_id={block.id}',
+        f'/admin/allocations?after={newest[Allocation]}',
+        '/admin/complaints', '/admin/complaints?status=open', f'/admin/complaints?after={newest[Complaint]}',
+        '/admin/fees', '/admin/fees?status=pending', f'/admin/fees?after={newest[Fee]}',
+        '/admin/rooms', '/admin/rooms?status=available', f'/admin/rooms?block_id={block.id}',
+        f'/admin/rooms?after={newest[Room]}',
+        '/admin/students/search?q=S1', f'/admin/application/{pending.id}/rooms',
+        f'/admin/application/{pending.id}/rooms?block=&q=1',
+    ]
+    for page in pages:
+        assert admin.get(page).status_code == 200, page
+
+    # The student pages include the room catalog behind /student/rooms
+    client = app.test_client()
+    client.post('/login', data={'username': student.username, 'password': 'benchmark'})
+    for page in ['/student/dashboard', '/student/rooms', '/student/complaints', '/student/fees']:
+        assert client.get(page).status_code == 200, page
+    sweep_overdue_fees()
+
+    connection = db.session.connection()
+    failures = []
+    for statement, parameters in statements:
+        plan = [row[-1] for row in connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)]
+        scans = full_scans(statement, plan)
+        if scans:
+            failures.append(f"{'; '.join(scans)}: {' '.join(statement.split())}")
+    assert not failures, '\n'.join(failures)
@@ -0,0 +1,31 @@
+"""The room picker on the applications page must offer every room that
+approve_application would accept."""
+
+from werkzeug.security import generate_password_hash
+
+from app import db, User, Block, Room, Application
+
+def test_search_matches_room_type_like_approve(admin_client):
+    password_hash = generate_password_hash('test', method='pbkdf2:sha256:1')
+    student = User(username='student', email='student@hostel.com', password_hash=password_hash,
+                   full_name='Student', role='student', gender='male', student_id='S1')
+    block = Block(name='Block A', gender='male')
+    db.session.add_all([student, block])
+    db.session.flush()
+    rooms = {room_type: Room(block_id=block.id, floor=1, room_number=str(100 + i), capacity=2, current_occupancy=0,
+                             status='available', room_type=room_type, price=5000)
+             for i, room_type in enumerate(['AC', 'Non-AC', None])}
+    db.session.add_all(rooms.values())
+    application = Application(student_id=student.id, preferred_room_type='ac')
+    db.session.add(application)
+    db.session.commit()
+
+    client = admin_client
+    found = {room['id'] for room in client.get(f'/admin/application/{application.id}/rooms').get_json()['rooms']}
+    assert found == {rooms['AC'].id, rooms[None].id}
+
+    # approve_application turns down the room the search leaves out and accepts the untyped one
+    for room_type in ['Non-AC', None]:
+        client.post(f'/admin/application/{application.id}/approve', data={'room_id': rooms[room_type].id})
+        db.session.expire_all()
+        assert (application.status == 'approved') == (rooms[room_type].id in found)